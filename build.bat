@@ -6,14 +6,24 @@ REM Install PyInstaller if not already installed
 pip show pyinstaller >nul 2>&1
 if errorlevel 1 (
     echo Installing PyInstaller...
-    pip install pyinstaller
+    pip install "pyinstaller>=6.6"
 )
 
 echo.
-echo Building executable...
-pyinstaller --onefile --windowed --name=PobreMediaPlayer --icon=NONE player.py
+if /I "%~1"=="fast" (
+    REM Fast-launching build: onedir, trimmed Qt, optimized bytecode
+    echo Building fast-launching folder build...
+    python build_profiles.py build fast
 
-echo.
-echo Build complete! Executable is in the dist\ folder.
+    echo.
+    echo Build complete! Application folder is in dist\fast\PobreMediaPlayer\
+    echo Compare profiles with: python build_profiles.py bench
+) else (
+    echo Building executable...
+    pyinstaller --onefile --windowed --name=PobreMediaPlayer --icon=NONE player.py
+
+    echo.
+    echo Build complete! Executable is in the dist\ folder.
+)
 echo.
 pause
@@ -5,13 +5,23 @@ echo ""
 # Install PyInstaller if not already installed
 if ! pip show pyinstaller > /dev/null 2>&1; then
     echo "Installing PyInstaller..."
-    pip install pyinstaller
+    pip install "pyinstaller>=6.6"
 fi
 
 echo ""
-echo "Building executable..."
-pyinstaller --onefile --windowed --name=PobreMediaPlayer player.py
+if [ "$1" = "fast" ]; then
+    # Fast-launching build: onedir, trimmed Qt, optimized bytecode
+    echo "Building fast-launching folder build..."
+    python3 build_profiles.py build fast
 
-echo ""
-echo "Build complete! Executable is in the dist/ folder."
+    echo ""
+    echo "Build complete! Application folder is in dist/fast/PobreMediaPlayer/"
+    echo "Compare profiles with: python3 build_profiles.py bench"
+else
+    echo "Building executable..."
+    pyinstaller --onefile --windowed --name=PobreMediaPlayer player.py
+
+    echo ""
+    echo "Build complete! Executable is in the dist/ folder."
+fi
 echo ""
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Build profiles for Pobre Media Player
+
+Builds the player with PyInstaller using one of these profiles:
+- onefile: Single portable executable (same as build.sh/build.bat). Extracts
+           the whole bundle to a temp directory on every launch.
+- fast:    Onedir layout (nothing to extract at launch), unused Qt modules
+           and plugins excluded, bytecode precompiled at optimize level 2.
+
+Each profile builds into dist/<profile>/ so they can be compared side by side.
+
+Usage:
+    python build_profiles.py build [onefile|fast ...]
+    python build_profiles.py bench [onefile|fast ...] [--runs N]
+
+'bench' reports bundle size and launch-to-first-paint time for each built
+profile, using the FIRST_PAINT_ENV startup probe in player.py.
+"""
+
+import os
+import sys
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+from src.config import FIRST_PAINT_ENV
+
+
+APP_NAME = "PobreMediaPlayer"
+ENTRY_POINT = "player.py"
+
+# PyQt6 modules the player never imports (only QtCore, QtGui, QtWidgets,
+# QtNetwork, QtMultimedia and QtMultimediaWidgets are needed)
+QT_EXCLUDE_MODULES = [
+    "PyQt6.QtBluetooth",
+    "PyQt6.QtDBus",
+    "PyQt6.QtDesigner",
+    "PyQt6.QtHelp",
+    "PyQt6.QtNfc",
+    "PyQt6.QtPdf",
+    "PyQt6.QtPdfWidgets",
+    "PyQt6.QtPositioning",
+    "PyQt6.QtPrintSupport",
+    "PyQt6.QtQml",
+    "PyQt6.QtQuick",
+    "PyQt6.QtQuick3D",
+    "PyQt6.QtQuickWidgets",
+    "PyQt6.QtRemoteObjects",
+    "PyQt6.QtSensors",
+    "PyQt6.QtSerialPort",
+    "PyQt6.QtSpatialAudio",
+    "PyQt6.QtSql",
+    "PyQt6.QtSvg",
+    "PyQt6.QtSvgWidgets",
+    "PyQt6.QtTest",
+    "PyQt6.QtTextToSpeech",
+    "PyQt6.QtWebChannel",
+    "PyQt6.QtWebEngineCore",
+    "PyQt6.QtWebEngineQuick",
+    "PyQt6.QtWebEngineWidgets",
+    "PyQt6.QtWebSockets",
+    "PyQt6.QtXml",
+    "tkinter",
+]
+
+# Qt plugins (relative to the bundled Qt6/plugins directory) that are not
+# needed for local video playback on any target. eglfs/linuxfb display
+# backends (egldeviceintegrations) and evdev/libinput/tslib input (generic)
+# are kept: kiosks often run without X11 or Wayland.
+QT_EXCLUDE_PLUGINS = [
+    "networkinformation",
+    "tls",
+    "platforms/*minimal*",
+    "platforms/*offscreen*",
+    "platforms/*vnc*",
+    "platforms/*webgl*",
+    "imageformats/*icns*",
+    "imageformats/*pdf*",
+    "imageformats/*tga*",
+    "imageformats/*tiff*",
+    "imageformats/*wbmp*",
+    "imageformats/*webp*",
+]
+
+PROFILES = {
+    "onefile": {
+        "description": "single executable, extracted on every launch",
+        "args": ["--onefile"],
+        "onedir": False,
+    },
+    "fast": {
+        "description": "onedir, trimmed Qt, optimized bytecode",
+        "args": (["--onedir", "--optimize", "2", "--noupx"]
+                 + [arg for module in QT_EXCLUDE_MODULES for arg in ("--exclude-module", module)]),
+        "onedir": True,
+    },
+}
+
+
+def dist_dir(profile):
+    """Output directory for a profile"""
+    return os.path.join("dist", profile)
+
+
+def executable_path(profile):
+    """Path to the built executable for a profile"""
+    name = APP_NAME + (".exe" if os.name == 'nt' else "")
+    if PROFILES[profile]["onedir"]:
+        return os.path.join(dist_dir(profile), APP_NAME, name)
+    return os.path.join(dist_dir(profile), name)
+
+
+def prune_qt_plugins(bundle_dir):
+    """Remove excluded Qt plugins and translations from a onedir bundle"""
+    removed = 0
+    for qt_dir in glob.glob(os.path.join(bundle_dir, "**", "Qt6"), recursive=True):
+        for pattern in QT_EXCLUDE_PLUGINS:
+            for path in glob.glob(os.path.join(qt_dir, "plugins", pattern)):
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+                removed += 1
+        translations = os.path.join(qt_dir, "translations")
+        if os.path.isdir(translations):
+            shutil.rmtree(translations)
+            removed += 1
+    return removed
+
+
+def build(profile):
+    """Build one profile with PyInstaller"""
+    print(f"Building profile '{profile}' ({PROFILES[profile]['description']})...")
+    command = [
+        sys.executable, "-m", "PyInstaller",
+        "--noconfirm", "--clean", "--windowed",
+        f"--name={APP_NAME}",
+        f"--distpath={dist_dir(profile)}",
+        f"--workpath={os.path.join('build', profile)}",
+        *PROFILES[profile]["args"],
+        ENTRY_POINT,
+    ]
+    subprocess.run(command, check=True)
+
+    if PROFILES[profile]["onedir"]:
+        removed = prune_qt_plugins(os.path.join(dist_dir(profile), APP_NAME))
+        print(f"Removed {removed} unused Qt plugin/translation entries")
+    print(f"Built: {executable_path(profile)}")
+
+
+def bundle_size(profile):
+    """Total size in bytes of a profile's build output"""
+    if not PROFILES[profile]["onedir"]:
+        return os.path.getsize(executable_path(profile))
+    total = 0
+    for root, _, files in os.walk(os.path.join(dist_dir(profile), APP_NAME)):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def measure_first_paint(executable, timeout=60):
+    """
+    Launch the player once and return seconds until its window first paints
+
+    Returns:
+        Elapsed seconds, or None if the player did not report a paint in time
+    """
+    fd, probe_file = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    os.remove(probe_file)
+    env = dict(os.environ, **{FIRST_PAINT_ENV: probe_file})
+    try:
+        start = time.time()
+        process = subprocess.Popen([executable], env=env)
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            return None
+        if not os.path.exists(probe_file):
+            return None
+        with open(probe_file, 'r', encoding='utf-8') as f:
+            return float(f.read()) - start
+    finally:
+        if os.path.exists(probe_file):
+            os.remove(probe_file)
+
+
+def bench(profiles, runs):
+    """Print bundle size and launch-to-first-paint for each built profile"""
+    print(f"{'Profile':<10} {'Size (MB)':>10} {'First paint min (s)':>20} {'median (s)':>11}")
+    for profile in profiles:
+        executable = executable_path(profile)
+        if not os.path.exists(executable):
+            print(f"{profile:<10} not built (run: python build_profiles.py build {profile})")
+            continue
+        size_mb = bundle_size(profile) / (1024 * 1024)
+        # First launch warms the OS file cache and is not counted
+        measure_first_paint(executable)
+        timings = [t for t in (measure_first_paint(executable) for _ in range(runs)) if t is not None]
+        if not timings:
+            print(f"{profile:<10} {size_mb:>10.1f} {'no paint reported':>20}")
+            continue
+        print(f"{profile:<10} {size_mb:>10.1f} {min(timings):>20.2f} {statistics.median(timings):>11.2f}")
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Build and benchmark Pobre Media Player build profiles.")
+    parser.add_argument("command", choices=["build", "bench"])
+    parser.add_argument("profiles", nargs="*", metavar="PROFILE",
+                        help=f"profiles to build or benchmark: {', '.join(PROFILES)} (default: all)")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="launches per profile for 'bench' (default: 5)")
+    args = parser.parse_args(argv)
+    profiles = args.profiles or list(PROFILES)
+    unknown = [profile for profile in profiles if profile not in PROFILES]
+    if unknown:
+        parser.error(f"unknown profile: {', '.join(unknown)}")
+
+    if args.command == "build":
+        for profile in profiles:
+            build(profile)
+    else:
+        bench(profiles, max(1, args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
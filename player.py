@@ -10,10 +10,11 @@ For code organization, see the src/ directory:
 - src/utils/ - Utility functions (updater, etc.)
 """
 
+import os
 import sys
 from PyQt6.QtWidgets import QApplication
 
-from src.config import VERSION, APP_NAME
+from src.config import VERSION, APP_NAME, FIRST_PAINT_ENV
 from src.player import VideoPlayer
 
 
@@ -24,6 +25,13 @@ def main():
     app.setApplicationVersion(VERSION)
     
     player = VideoPlayer()
+    
+    # Startup measurement mode used by build_profiles.py
+    first_paint_file = os.environ.get(FIRST_PAINT_ENV)
+    if first_paint_file:
+        from src.utils.startup_probe import FirstPaintProbe
+        FirstPaintProbe(player, first_paint_file)
+    
     player.show()
     
     sys.exit(app.exec())
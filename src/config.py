@@ -8,3 +8,15 @@ APP_NAME = "Pobre Media Player"
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 CONTROLS_MAX_HEIGHT = 72
+
+# Keyboard control (defaults; can be overridden in the user's keybindings file)
+KEYBINDINGS_FILE = "keybindings.json"
+SEEK_STEP_MS = 3000  # Jump for a single press of a seek key
+SEEK_HOLD_SPEED_MS = 10000  # Initial seek speed while held (video ms per second)
+SEEK_MAX_SPEED_MS = 120000  # Maximum seek speed while held (video ms per second)
+SEEK_ACCELERATION = 2.0  # Seek speed multiplier per second a seek key is held
+SEEK_COALESCE_MS = 80  # Held-key seeks are merged and applied at most this often
+VOLUME_STEP = 5
+
+# Set to a file path to record launch-to-first-paint time and exit (see build_profiles.py)
+FIRST_PAINT_ENV = "PMP_FIRST_PAINT_FILE"
@@ -1,6 +1,15 @@
 """
 Video player components
+
+VideoPlayer is imported lazily so the key binding and seek helpers can be
+used without loading QtMultimedia.
 """
-from .video_player import VideoPlayer
 
 __all__ = ['VideoPlayer']
+
+
+def __getattr__(name):
+    if name == 'VideoPlayer':
+        from .video_player import VideoPlayer
+        return VideoPlayer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
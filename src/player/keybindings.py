@@ -0,0 +1,173 @@
+"""
+Keyboard shortcut configuration for the video player
+
+Shortcuts are a table of action name -> key sequences. Defaults can be
+overridden by a JSON file in the user's config directory, e.g.:
+
+    {
+        "bindings": {"seek_forward": ["Right", "D"], "add_timestamp": ["S", "Return"]},
+        "seek_step_seconds": 5,
+        "volume_step": 10
+    }
+
+Keys use Qt's portable key names ("Space", "Ctrl+Right", "S", ...). Actions
+not listed in the file keep their default keys; an empty list unbinds one.
+"""
+import os
+import json
+import math
+from PyQt6.QtCore import Qt, QKeyCombination, QStandardPaths
+from PyQt6.QtGui import QKeySequence
+
+from ..config import (KEYBINDINGS_FILE, SEEK_STEP_MS, SEEK_HOLD_SPEED_MS,
+                      SEEK_MAX_SPEED_MS, SEEK_ACCELERATION, VOLUME_STEP)
+
+
+# Action name -> (description, repeats while the key is held)
+ACTIONS = {
+    "play_pause": ("Play/Pause", False),
+    "add_timestamp": ("Add current time to Highlight CSV", False),
+    "direction_left": ("Set last CSV row to Left", False),
+    "direction_right": ("Set last CSV row to Right", False),
+    "seek_backward": ("Skip backward (accelerates while held)", True),
+    "seek_forward": ("Skip forward (accelerates while held)", True),
+    "volume_up": ("Volume up", True),
+    "volume_down": ("Volume down", True),
+}
+
+DEFAULT_KEYBINDINGS = {
+    "play_pause": ["Space"],
+    "add_timestamp": ["S"],
+    "direction_left": ["L"],
+    "direction_right": ["R"],
+    "seek_backward": ["Left"],
+    "seek_forward": ["Right"],
+    "volume_up": ["Up"],
+    "volume_down": ["Down"],
+}
+
+# Setting name in the JSON file -> (default value, scale to internal units).
+# Every setting must be at least 1 after scaling (1 ms, 1x, 1%).
+SETTINGS = {
+    "seek_step_seconds": (SEEK_STEP_MS, 1000),
+    "seek_hold_speed": (SEEK_HOLD_SPEED_MS, 1000),
+    "seek_max_speed": (SEEK_MAX_SPEED_MS, 1000),
+    "seek_acceleration": (SEEK_ACCELERATION, 1),
+    "volume_step": (VOLUME_STEP, 1),
+}
+
+
+def keybindings_path():
+    """Path of the user's keybindings file"""
+    config_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppConfigLocation)
+    return os.path.join(config_dir, KEYBINDINGS_FILE)
+
+
+def load_keybindings(path=None):
+    """
+    Load key bindings and step settings, falling back to defaults
+
+    Args:
+        path: JSON file to read (defaults to keybindings_path())
+
+    Returns:
+        (bindings, settings, errors) where bindings maps action name to a
+        list of key strings, settings maps setting name to its value in
+        internal units (ms, ms per second, percent) and errors lists
+        problems found
+    """
+    bindings = {action: list(keys) for action, keys in DEFAULT_KEYBINDINGS.items()}
+    settings = {name: default for name, (default, _) in SETTINGS.items()}
+    errors = []
+
+    path = path or keybindings_path()
+    if not os.path.exists(path):
+        return bindings, settings, errors
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        return bindings, settings, [f"Could not read {path}: {e}"]
+    if not isinstance(data, dict):
+        return bindings, settings, [f"{path}: expected a JSON object"]
+
+    user_bindings = data.get("bindings") or {}
+    if not isinstance(user_bindings, dict):
+        errors.append(f"Invalid bindings: expected an object, got {user_bindings!r}")
+        user_bindings = {}
+    for action, keys in user_bindings.items():
+        if action not in ACTIONS:
+            errors.append(f"Unknown action: {action}")
+        elif isinstance(keys, str):
+            bindings[action] = [keys]
+        elif isinstance(keys, list) and all(isinstance(key, str) for key in keys):
+            bindings[action] = keys
+        else:
+            errors.append(f"Invalid keys for {action}: {keys!r}")
+
+    for name, (default, scale) in SETTINGS.items():
+        if name not in data:
+            continue
+        value = data[name]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value * scale):
+            errors.append(f"Invalid value for {name}: {value!r}")
+            continue
+        converted = type(default)(value * scale)
+        if converted < 1:
+            errors.append(f"Value for {name} is too small: {value!r}")
+            continue
+        settings[name] = converted
+    return bindings, settings, errors
+
+
+def key_code(key_combination):
+    """Integer lookup key for a QKeyCombination, ignoring the keypad flag"""
+    modifiers = key_combination.keyboardModifiers() & ~Qt.KeyboardModifier.KeypadModifier
+    return QKeyCombination(modifiers, key_combination.key()).toCombined()
+
+
+def lookup_key(key_map, key_combination):
+    """
+    Find the key_map entry for a key press
+
+    The exact key combination wins; otherwise the bare key is used, so e.g.
+    Shift+S still triggers an action bound to S.
+    """
+    entry = key_map.get(key_code(key_combination))
+    if entry is None and key_combination.keyboardModifiers():
+        entry = key_map.get(key_combination.key().value)
+    return entry
+
+
+def build_key_map(bindings, handlers):
+    """
+    Build the dispatch table used on every key press
+
+    Args:
+        bindings: Action name -> list of key strings
+        handlers: Action name -> callable taking the auto-repeat flag
+
+    Returns:
+        (key_map, errors) where key_map maps key_code() values to
+        (handler, repeatable) tuples
+    """
+    key_map = {}
+    owners = {}
+    errors = []
+    for action, keys in bindings.items():
+        handler = handlers.get(action)
+        if handler is None:
+            continue
+        repeatable = ACTIONS[action][1]
+        for key in keys:
+            sequence = QKeySequence.fromString(key, QKeySequence.SequenceFormat.PortableText)
+            if sequence.count() != 1 or sequence[0].key() == Qt.Key.Key_unknown:
+                errors.append(f"Invalid key for {action}: {key!r}")
+                continue
+            code = key_code(sequence[0])
+            if code in owners:
+                errors.append(f"{key} is bound to both {owners[code]} and {action}")
+            owners[code] = action
+            key_map[code] = (handler, repeatable)
+    return key_map, errors
@@ -0,0 +1,104 @@
+"""
+Accelerating, coalesced keyboard seeking
+"""
+import math
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, pyqtSignal
+
+from ..config import SEEK_COALESCE_MS
+
+
+class SeekAccelerator(QObject):
+    """
+    Turn seek key presses into accelerating, throttled seeks
+
+    A press jumps by one step. While the key is held, the target moves at a
+    speed that grows by the acceleration factor per second held (up to the
+    maximum speed), so the distance covered depends on how long the key is
+    held, not on the OS key-repeat rate. The media player is seeked at most
+    once per SEEK_COALESCE_MS, always to the latest target, so holding a key
+    never queues up stale seeks.
+    """
+
+    # Emitted with the new target position (ms) on every key press
+    target_changed = pyqtSignal(int)
+
+    def __init__(self, media_player, step_ms, hold_speed, max_speed, acceleration, parent=None):
+        """
+        Args:
+            media_player: The QMediaPlayer to seek
+            step_ms: Jump for a single press
+            hold_speed: Initial seek speed while held (video ms per second)
+            max_speed: Maximum seek speed while held (video ms per second)
+            acceleration: Speed multiplier per second held (>= 1)
+        """
+        super().__init__(parent)
+        self.media_player = media_player
+        self.step_ms = step_ms
+        self.hold_speed = hold_speed
+        self.max_speed = max(hold_speed, max_speed)
+        self.acceleration = acceleration
+        self.direction = 0
+        self.anchor = None
+        self.target = None
+        self.pending = False
+        self.hold_timer = QElapsedTimer()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(SEEK_COALESCE_MS)
+        self.timer.timeout.connect(self.check_pending)
+
+    def hold_distance(self, elapsed_ms):
+        """Distance in ms covered after holding a seek key for elapsed_ms"""
+        seconds = elapsed_ms / 1000
+        if self.acceleration <= 1:
+            return int(self.hold_speed * seconds)
+        log_rate = math.log(self.acceleration)
+        # Time at which the growing speed reaches the maximum
+        cap_seconds = math.log(self.max_speed / self.hold_speed) / log_rate
+        if seconds <= cap_seconds:
+            return int(self.hold_speed * (self.acceleration ** seconds - 1) / log_rate)
+        ramp = (self.max_speed - self.hold_speed) / log_rate
+        return int(ramp + self.max_speed * (seconds - cap_seconds))
+
+    def seek(self, direction, repeat=False):
+        """
+        Move the target position backward (-1) or forward (1)
+
+        Args:
+            direction: -1 to seek backward, 1 to seek forward
+            repeat: True for auto-repeat events of a held key
+        """
+        if repeat and direction == self.direction and self.anchor is not None:
+            position = self.anchor + direction * self.hold_distance(self.hold_timer.elapsed())
+        else:
+            # Rapid separate presses build on the not yet applied target
+            start = self.target if self.timer.isActive() else self.media_player.position()
+            self.anchor = start + direction * self.step_ms
+            self.hold_timer.start()
+            position = self.anchor
+        self.direction = direction
+
+        duration = self.media_player.duration()
+        self.target = max(0, min(duration, position))
+        self.target_changed.emit(self.target)
+
+        if self.timer.isActive():
+            self.pending = True
+        else:
+            self.apply()
+
+    def is_seeking(self):
+        """True while keyboard seeks are in progress or settling"""
+        return self.timer.isActive()
+
+    def apply(self):
+        """Seek the media player to the current target"""
+        self.pending = False
+        self.media_player.setPosition(self.target)
+        self.timer.start()
+
+    def check_pending(self):
+        """Apply the latest target if it changed since the last seek"""
+        if self.pending:
+            self.apply()
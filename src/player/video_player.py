@@ -13,6 +13,9 @@ from PyQt6.QtMultimediaWidgets import QVideoWidget
 from ..config import VERSION, APP_NAME, WINDOW_WIDTH, WINDOW_HEIGHT, CONTROLS_MAX_HEIGHT
 from ..utils.updater import check_for_updates
 from ..tools.highlight_csv import HighlightCSVWindow
+from ..tools.highlight_format import format_time
+from .keybindings import ACTIONS, build_key_map, keybindings_path, load_keybindings, lookup_key
+from .seek_accelerator import SeekAccelerator
 
 
 class VideoPlayer(QMainWindow):
@@ -67,6 +70,9 @@ class VideoPlayer(QMainWindow):
         # Highlight CSV window reference
         self.highlight_csv_window = None
         
+        # Keyboard shortcuts
+        self.init_key_bindings()
+        
     def init_ui(self):
         """Initialize the user interface"""
         # Central widget
@@ -150,6 +156,41 @@ class VideoPlayer(QMainWindow):
         footer_label.setStyleSheet("color: #888; padding-right: 10px;")
         self.statusBar().addPermanentWidget(footer_label)
         
+    def init_key_bindings(self):
+        """Load keyboard shortcuts and build the key dispatch table"""
+        bindings, settings, errors = load_keybindings()
+        self.key_bindings = bindings
+        self.volume_step = settings["volume_step"]
+        
+        # Held seek keys accelerate and are merged into one pending seek
+        self.seek_accelerator = SeekAccelerator(
+            self.media_player,
+            settings["seek_step_seconds"],
+            settings["seek_hold_speed"],
+            settings["seek_max_speed"],
+            settings["seek_acceleration"],
+            self
+        )
+        self.seek_accelerator.target_changed.connect(self.show_position)
+        
+        # Action registry: action name -> handler(repeat)
+        handlers = {
+            "play_pause": lambda repeat: self.play_pause(),
+            "add_timestamp": lambda repeat: self.add_highlight_timestamp(),
+            "direction_left": lambda repeat: self.set_highlight_direction("Left"),
+            "direction_right": lambda repeat: self.set_highlight_direction("Right"),
+            "seek_backward": lambda repeat: self.seek_accelerator.seek(-1, repeat),
+            "seek_forward": lambda repeat: self.seek_accelerator.seek(1, repeat),
+            "volume_up": lambda repeat: self.step_volume(self.volume_step),
+            "volume_down": lambda repeat: self.step_volume(-self.volume_step),
+        }
+        self.key_map, map_errors = build_key_map(bindings, handlers)
+        errors += map_errors
+        
+        if errors:
+            more = f" (+{len(errors) - 1} more)" if len(errors) > 1 else ""
+            self.statusBar().showMessage(f"Keyboard shortcuts: {errors[0]}{more}", 10000)
+        
     def create_menu_bar(self):
         """Create menu bar with File, Tools, and Help menus"""
         menubar = self.menuBar()
@@ -228,6 +269,13 @@ class VideoPlayer(QMainWindow):
             
     def position_changed(self, position):
         """Update position slider and label"""
+        # While a keyboard seek is in progress the UI shows its target instead
+        if self.seek_accelerator.is_seeking():
+            return
+        self.show_position(position)
+        
+    def show_position(self, position):
+        """Show a position on the slider and label"""
         if not self.position_slider.isSliderDown():
             self.position_slider.setValue(position)
         self.position_label.setText(self.format_time(position))
@@ -246,6 +294,11 @@ class VideoPlayer(QMainWindow):
         position = self.position_slider.sliderPosition()
         self.media_player.setPosition(position)
     
+    def step_volume(self, delta):
+        """Change volume by delta percent"""
+        new_volume = max(0, min(100, self.volume_slider.value() + delta))
+        self.volume_slider.setValue(new_volume)
+    
     def change_volume(self, value):
         """Change volume when slider is moved"""
         volume = value / 100.0
@@ -254,11 +307,7 @@ class VideoPlayer(QMainWindow):
         
     def format_time(self, ms):
         """Format milliseconds to HH:MM:SS"""
-        s = ms // 1000
-        h = s // 3600
-        m = (s % 3600) // 60
-        s = s % 60
-        return f"{h:02d}:{m:02d}:{s:02d}"
+        return format_time(ms)
         
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event"""
@@ -292,60 +341,51 @@ class VideoPlayer(QMainWindow):
                         QMessageBox.warning(self, "Invalid File", "Please drop a valid video file (MP4, AVI, MKV, MOV)")
                 return True
             elif event.type() == QEvent.Type.KeyPress:
-                # Forward keyboard events to main window
-                self.keyPressEvent(event)
-                return True
+                # Handle bound shortcuts; other keys reach the widget as usual
+                if self.handle_key(event):
+                    return True
         return super().eventFilter(obj, event)
     
+    def handle_key(self, event: QKeyEvent):
+        """Dispatch a key press to its bound action, returning False if unbound"""
+        entry = lookup_key(self.key_map, event.keyCombination())
+        if entry is None:
+            return False
+        handler, repeatable = entry
+        if repeatable or not event.isAutoRepeat():
+            handler(event.isAutoRepeat())
+        return True
+    
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard shortcuts"""
-        if event.key() == Qt.Key.Key_Space:
-            self.play_pause()
-        elif event.key() == Qt.Key.Key_S:
-            if self.highlight_csv_window:
-                current_time = self.format_time(self.media_player.position())
-                self.highlight_csv_window.add_row_with_time(current_time)
-        elif event.key() == Qt.Key.Key_L:
-            if self.highlight_csv_window:
-                self.highlight_csv_window.update_last_direction("Left")
-        elif event.key() == Qt.Key.Key_R:
-            if self.highlight_csv_window:
-                self.highlight_csv_window.update_last_direction("Right")
-        elif event.key() == Qt.Key.Key_Left:
-            current_pos = self.media_player.position()
-            new_pos = max(0, current_pos - 3000)
-            self.media_player.setPosition(new_pos)
-        elif event.key() == Qt.Key.Key_Right:
-            current_pos = self.media_player.position()
-            duration = self.media_player.duration()
-            new_pos = min(duration, current_pos + 3000)
-            self.media_player.setPosition(new_pos)
-        elif event.key() == Qt.Key.Key_Up:
-            current_volume = self.volume_slider.value()
-            new_volume = min(100, current_volume + 5)
-            self.volume_slider.setValue(new_volume)
-        elif event.key() == Qt.Key.Key_Down:
-            current_volume = self.volume_slider.value()
-            new_volume = max(0, current_volume - 5)
-            self.volume_slider.setValue(new_volume)
-        else:
+        if not self.handle_key(event):
             super().keyPressEvent(event)
+    
+    def add_highlight_timestamp(self):
+        """Add the current video time to the Highlight CSV window"""
+        if self.highlight_csv_window:
+            current_time = self.format_time(self.media_player.position())
+            self.highlight_csv_window.add_row_with_time(current_time)
+    
+    def set_highlight_direction(self, direction):
+        """Set the direction of the last Highlight CSV row"""
+        if self.highlight_csv_window:
+            self.highlight_csv_window.update_last_direction(direction)
             
     def show_about(self):
         """Show about dialog"""
+        shortcuts = "".join(
+            f"<li>{' / '.join(keys)}: {ACTIONS[action][0]}</li>"
+            for action, keys in self.key_bindings.items() if keys
+        )
         about_text = f"""
         <h2>{APP_NAME}</h2>
         <p><b>Version:</b> {VERSION}</p>
         <p><b>Description:</b> A lightweight, portable media player for Windows and Linux</p>
         <p><b>Author:</b> Peter Barredo and his AI partner</p>
         <p><b>Keyboard Shortcuts:</b></p>
-        <ul>
-            <li>Space: Play/Pause</li>
-            <li>S: Add current time to Highlight CSV</li>
-            <li>L/R: Set last CSV row to Left/Right</li>
-            <li>Left/Right Arrow: Skip -3/+3 seconds</li>
-            <li>Up/Down Arrow: Volume +/-</li>
-        </ul>
+        <ul>{shortcuts}</ul>
+        <p>Customize shortcuts in:<br>{keybindings_path()}</p>
         """
         QMessageBox.about(self, f"About {APP_NAME}", about_text)
     
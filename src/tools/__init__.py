@@ -1,6 +1,15 @@
 """
 Tools for video analysis and processing
+
+GUI tools are imported lazily so headless tools (e.g. highlight_batch) can be
+used without loading PyQt6.
 """
-from .highlight_csv import HighlightCSVWindow
 
 __all__ = ['HighlightCSVWindow']
+
+
+def __getattr__(name):
+    if name == 'HighlightCSVWindow':
+        from .highlight_csv import HighlightCSVWindow
+        return HighlightCSVWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
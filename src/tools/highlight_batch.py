@@ -0,0 +1,224 @@
+"""
+Highlight Batch - Headless processing of many Highlight CSV files
+
+Parses highlight CSVs in parallel worker processes, validates and normalizes
+their timestamps, merges the markers by session date and camera, drops
+near-duplicate markers and writes the combined result.
+
+This module does not import PyQt6; parsing is shared with the Highlight CSV
+window through highlight_format.
+
+Usage:
+    python -m src.tools.highlight_batch [options] PATH [PATH ...]
+"""
+import os
+import re
+import math
+import sys
+import csv
+import argparse
+from multiprocessing import Pool
+
+from .highlight_format import (HighlightFormatError, format_date, format_timestamp,
+                               iter_highlights, write_highlights)
+
+
+DEFAULT_TOLERANCE = 1.0
+COMBINED_COLUMNS = ["Date", "Camera", "Placement", "Time", "Side"]
+
+
+def iter_csv_paths(paths):
+    """Yield CSV file paths from files and (recursively) directories"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith('.csv'):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def process_file(path, strict=False):
+    """
+    Parse one highlight CSV into markers grouped by (date, camera)
+
+    Rows are streamed, and exact duplicates collapse into a set, so worker
+    memory depends on the number of distinct markers rather than file size.
+
+    Returns:
+        (path, groups, row_count, invalid_count, error) where groups maps
+        (date, camera) to a set of (time_ms, side) tuples, invalid_count is
+        the number of malformed rows skipped and error is None on success
+    """
+    groups = {}
+    row_count = 0
+    invalid_count = 0
+
+    def count_invalid(line_num, message):
+        nonlocal invalid_count
+        invalid_count += 1
+
+    try:
+        with open(path, 'r', newline='', encoding='utf-8-sig') as csvfile:
+            for date, marker in iter_highlights(csvfile, strict=strict, on_invalid=count_invalid):
+                groups.setdefault((date, marker.camera), set()).add((marker.time_ms, marker.side))
+                row_count += 1
+    except (OSError, UnicodeDecodeError, csv.Error, HighlightFormatError) as e:
+        return path, {}, 0, 0, str(e)
+    return path, groups, row_count, invalid_count, None
+
+
+def _process_file_strict(path):
+    return process_file(path, strict=True)
+
+
+def dedupe_markers(markers, tolerance_ms):
+    """
+    Drop markers within tolerance_ms of an earlier kept marker on the same side
+
+    Args:
+        markers: Iterable of (time_ms, side) tuples
+        tolerance_ms: Window in milliseconds; 0 only removes exact duplicates
+
+    Returns:
+        Sorted list of the kept (time_ms, side) tuples
+    """
+    kept = []
+    last_kept = {}
+    for time_ms, side in sorted(markers):
+        previous = last_kept.get(side)
+        if previous is not None and time_ms - previous <= tolerance_ms:
+            continue
+        last_kept[side] = time_ms
+        kept.append((time_ms, side))
+    return kept
+
+
+def merge_files(paths, jobs=None, strict=False, chunksize=8, on_error=None):
+    """
+    Parse files in parallel and merge their markers by (date, camera)
+
+    Results are consumed as soon as each worker finishes, so only the merged
+    groups are kept in memory.
+
+    Args:
+        paths: Iterable of CSV file paths
+        jobs: Number of worker processes (None for CPU count, 1 for in-process)
+        strict: Reject a whole file if any data row is malformed
+        chunksize: Number of files handed to a worker at a time
+        on_error: Optional callback(path, message) for files that failed
+                  or had malformed rows skipped
+
+    Returns:
+        (groups, stats) where groups maps (date, camera) to a set of
+        (time_ms, side) tuples and stats counts files, failures, accepted
+        rows and skipped (invalid) rows
+    """
+    worker = _process_file_strict if strict else process_file
+    merged = {}
+    stats = {'files': 0, 'failed': 0, 'rows': 0, 'invalid': 0}
+
+    def consume(results):
+        for path, groups, row_count, invalid_count, error in results:
+            stats['files'] += 1
+            if error is not None:
+                stats['failed'] += 1
+                if on_error:
+                    on_error(path, f"skipped file: {error}")
+                continue
+            stats['rows'] += row_count
+            if invalid_count:
+                stats['invalid'] += invalid_count
+                if on_error:
+                    on_error(path, f"{invalid_count} malformed rows skipped")
+            for key, markers in groups.items():
+                merged.setdefault(key, set()).update(markers)
+
+    if jobs == 1:
+        consume(map(worker, paths))
+    else:
+        with Pool(processes=jobs) as pool:
+            consume(pool.imap_unordered(worker, paths, chunksize=chunksize))
+    return merged, stats
+
+
+def write_combined(csvfile, sessions):
+    """Write all sessions to one CSV with Date/Camera/Placement/Time/Side columns"""
+    writer = csv.writer(csvfile)
+    writer.writerow(COMBINED_COLUMNS)
+    for (date, camera), markers in sessions:
+        for placement, (time_ms, side) in enumerate(markers, start=1):
+            writer.writerow([format_date(date), camera, placement, format_timestamp(time_ms), side])
+
+
+def write_split(output_dir, sessions):
+    """Write one Highlight CSV (same format as the GUI) per date and camera"""
+    os.makedirs(output_dir, exist_ok=True)
+    for (date, camera), markers in sessions:
+        safe_camera = re.sub(r'[^\w.-]', '_', camera)
+        file_name = os.path.join(output_dir, f"highlights_{date.strftime('%Y%m%d')}_{safe_camera}.csv")
+        with open(file_name, 'w', newline='', encoding='utf-8') as csvfile:
+            write_highlights(csvfile, date,
+                             ((camera, format_timestamp(time_ms), side) for time_ms, side in markers))
+
+
+def build_parser():
+    """Create the command-line argument parser"""
+    parser = argparse.ArgumentParser(
+        prog="highlight_batch",
+        description="Validate, merge and dedupe Highlight CSV files without the GUI.")
+    parser.add_argument("paths", nargs="+", metavar="PATH",
+                        help="CSV files or directories to scan recursively")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("-o", "--output", default="-",
+                        help="combined CSV output file (default: stdout)")
+    output.add_argument("--split-dir",
+                        help="write one Highlight CSV per date and camera into this directory")
+    parser.add_argument("-t", "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"seconds within which markers on the same side are "
+                             f"treated as duplicates (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--strict", action="store_true",
+                        help="skip a whole file if any row is malformed (default: skip the row)")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not math.isfinite(args.tolerance) or args.tolerance < 0:
+        parser.error("--tolerance must be a non-negative number")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    def report_error(path, message):
+        print(f"{path}: {message}", file=sys.stderr)
+
+    merged, stats = merge_files(iter_csv_paths(args.paths), jobs=args.jobs,
+                                strict=args.strict, on_error=report_error)
+
+    tolerance_ms = int(round(args.tolerance * 1000))
+    sessions = [(key, dedupe_markers(merged.pop(key), tolerance_ms)) for key in sorted(merged)]
+    marker_count = sum(len(markers) for _, markers in sessions)
+
+    if args.split_dir:
+        write_split(args.split_dir, sessions)
+    elif args.output == "-":
+        write_combined(sys.stdout, sessions)
+    else:
+        with open(args.output, 'w', newline='', encoding='utf-8') as csvfile:
+            write_combined(csvfile, sessions)
+
+    print(f"Processed {stats['files']} files ({stats['failed']} skipped), "
+          f"{stats['rows']} rows ({stats['invalid']} malformed rows skipped) "
+          f"-> {marker_count} markers in {len(sessions)} sessions",
+          file=sys.stderr)
+    return 1 if stats['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
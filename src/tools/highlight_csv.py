@@ -1,14 +1,15 @@
 """
 Highlight CSV Tool - Create CSV files with video timestamps and direction markers
 """
-import os
-import csv
 from datetime import datetime
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QPushButton, QMessageBox, QFileDialog, QStyle,
                               QTableWidget, QTableWidgetItem, QHeaderView, QComboBox)
 from PyQt6.QtCore import QTimer
 
+from .highlight_format import (DEFAULT_CAMERA, HighlightFormatError, default_file_name,
+                               normalize_time, parse_time_to_ms, write_highlights)
+
 
 class HighlightCSVWindow(QMainWindow):
     """Non-modal window for creating highlight CSV with timestamps and directions"""
@@ -87,36 +88,27 @@ class HighlightCSVWindow(QMainWindow):
     
     def save_csv(self):
         """Save the table data to a CSV file"""
+        rows, invalid_rows = self.table_rows()
+        if invalid_rows:
+            QMessageBox.warning(
+                self,
+                "Invalid Time",
+                "Invalid time in row(s) " + ", ".join(str(row) for row in invalid_rows)
+                + ".\nUse HH:MM:SS (e.g. 00:01:23)."
+            )
+            return
+        
         file_name, _ = QFileDialog.getSaveFileName(
             self,
             "Save CSV File",
-            f"highlights_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            default_file_name(),
             "CSV Files (*.csv);;All Files (*.*)"
         )
         
         if file_name:
             try:
                 with open(file_name, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    # Write date header row
-                    current_date = datetime.now().strftime('%-m/%-d/%Y') if os.name != 'nt' else datetime.now().strftime('%#m/%#d/%Y')
-                    writer.writerow(['Date', current_date, '', '', ''])
-                    
-                    # Write column headers
-                    writer.writerow(['Placement', 'Camera', 'Time', 'Side'])
-                    
-                    # Write data
-                    for row in range(self.table.rowCount()):
-                        time_item = self.table.item(row, 0)
-                        direction_widget = self.table.cellWidget(row, 1)
-                        
-                        if time_item and direction_widget:
-                            placement = row + 1
-                            camera = "Cam1"
-                            time = time_item.text()
-                            side = direction_widget.currentText().lower()
-                            writer.writerow([placement, camera, time, side])
+                    write_highlights(csvfile, datetime.now(), rows)
                 
                 QMessageBox.information(self, "Success", f"CSV file saved to:\n{file_name}")
             except Exception as e:
@@ -133,16 +125,36 @@ class HighlightCSVWindow(QMainWindow):
                 direction_widget.setCurrentIndex(index)
                 self.statusBar().showMessage(f"Updated last row to: {direction}", 2000)
     
+    def table_rows(self):
+        """
+        Collect the table rows in export form
+        
+        Returns:
+            (rows, invalid_rows) where rows is a list of (camera, time, side)
+            with normalized times and invalid_rows lists the 1-based numbers
+            of rows whose time cannot be parsed
+        """
+        rows = []
+        invalid_rows = []
+        for row in range(self.table.rowCount()):
+            time_item = self.table.item(row, 0)
+            direction_widget = self.table.cellWidget(row, 1)
+            
+            if time_item and direction_widget:
+                try:
+                    time = normalize_time(time_item.text())
+                except HighlightFormatError:
+                    invalid_rows.append(row + 1)
+                    continue
+                rows.append((DEFAULT_CAMERA, time, direction_widget.currentText().lower()))
+        return rows, invalid_rows
+    
     def parse_time_to_ms(self, time_str):
         """Convert HH:MM:SS time string to milliseconds"""
         try:
-            parts = time_str.split(':')
-            if len(parts) == 3:
-                hours, minutes, seconds = map(int, parts)
-                return (hours * 3600 + minutes * 60 + seconds) * 1000
-        except:
-            pass
-        return 0
+            return parse_time_to_ms(time_str)
+        except HighlightFormatError:
+            return 0
     
     def play_all_timestamps(self):
         """Play video at each recorded timestamp sequentially"""
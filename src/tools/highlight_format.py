@@ -0,0 +1,167 @@
+"""
+Highlight CSV file format - reading, writing and timestamp handling
+
+This module has no Qt dependency so it can be shared by the Highlight CSV
+window and the headless batch tool; both read and write files through it.
+"""
+import csv
+from collections import namedtuple
+from datetime import datetime
+
+
+DATE_LABEL = "Date"
+COLUMNS = ["Placement", "Camera", "Time", "Side"]
+DEFAULT_CAMERA = "Cam1"
+SIDES = ("left", "right")
+
+Marker = namedtuple("Marker", ["placement", "camera", "time_ms", "side"])
+
+
+class HighlightFormatError(ValueError):
+    """Raised when a highlight CSV or one of its values is malformed"""
+
+
+def parse_time_to_ms(time_str):
+    """
+    Convert a HH:MM:SS (or MM:SS) time string to milliseconds
+
+    Seconds may carry a fractional part (e.g. 00:01:23.5).
+
+    Raises:
+        HighlightFormatError: If the string is not a valid timestamp
+    """
+    parts = str(time_str).strip().split(':')
+    if len(parts) not in (2, 3):
+        raise HighlightFormatError(f"Invalid timestamp: {time_str!r}")
+    if len(parts) == 2:
+        parts.insert(0, "0")
+    try:
+        hours = int(parts[0])
+        minutes = int(parts[1])
+        seconds = float(parts[2])
+    except ValueError:
+        raise HighlightFormatError(f"Invalid timestamp: {time_str!r}") from None
+    if hours < 0 or not 0 <= minutes < 60 or not 0 <= seconds < 60:
+        raise HighlightFormatError(f"Timestamp out of range: {time_str!r}")
+    return (hours * 3600 + minutes * 60) * 1000 + int(round(seconds * 1000))
+
+
+def format_time(ms):
+    """Format milliseconds to HH:MM:SS"""
+    s = ms // 1000
+    h = s // 3600
+    m = (s % 3600) // 60
+    s = s % 60
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+
+def format_timestamp(ms):
+    """Format milliseconds to HH:MM:SS, adding .mmm if there is a sub-second part"""
+    if ms % 1000:
+        return f"{format_time(ms)}.{ms % 1000:03d}"
+    return format_time(ms)
+
+
+def normalize_time(time_str):
+    """Return a timestamp in canonical HH:MM:SS[.mmm] form"""
+    return format_timestamp(parse_time_to_ms(time_str))
+
+
+def parse_date(date_str):
+    """
+    Parse the M/D/YYYY date from a highlight CSV header row
+
+    Raises:
+        HighlightFormatError: If the string is not a valid date
+    """
+    try:
+        return datetime.strptime(str(date_str).strip(), '%m/%d/%Y').date()
+    except ValueError:
+        raise HighlightFormatError(f"Invalid date: {date_str!r}") from None
+
+
+def format_date(value):
+    """Format a date as M/D/YYYY without zero padding"""
+    return f"{value.month}/{value.day}/{value.year}"
+
+
+def normalize_side(side):
+    """
+    Return a side in lowercase form (left/right)
+
+    Raises:
+        HighlightFormatError: If the side is not Left or Right
+    """
+    side = str(side).strip().lower()
+    if side not in SIDES:
+        raise HighlightFormatError(f"Invalid side: {side!r}")
+    return side
+
+
+def write_highlights(csvfile, date, rows):
+    """
+    Write highlight rows to an open text file
+
+    Args:
+        csvfile: File object opened for writing with newline=''
+        date: Session date (date/datetime) for the header row
+        rows: Iterable of (camera, time, side) tuples; placement is numbered
+              from 1 in iteration order
+    """
+    writer = csv.writer(csvfile)
+    writer.writerow([DATE_LABEL, format_date(date), '', '', ''])
+    writer.writerow(COLUMNS)
+    for placement, (camera, time, side) in enumerate(rows, start=1):
+        writer.writerow([placement, camera, time, side])
+
+
+def iter_highlights(csvfile, strict=True, on_invalid=None):
+    """
+    Stream markers from an open highlight CSV file
+
+    Yields (date, Marker) tuples one row at a time, so memory use does not
+    depend on file size. Timestamps and sides are validated and normalized.
+
+    Args:
+        csvfile: File object opened for reading with newline=''
+        strict: If False, malformed data rows are skipped instead of raising
+        on_invalid: Optional callback(line_num, message) for skipped rows
+
+    Raises:
+        HighlightFormatError: If the header is malformed, or a row is
+                              malformed and strict is True
+    """
+    reader = csv.reader(csvfile)
+    date_row = next(reader, None)
+    if not date_row or date_row[0].strip() != DATE_LABEL or len(date_row) < 2:
+        raise HighlightFormatError("Missing Date header row")
+    date = parse_date(date_row[1])
+
+    header = next(reader, None)
+    if header is None or [h.strip() for h in header[:len(COLUMNS)]] != COLUMNS:
+        raise HighlightFormatError("Missing Placement/Camera/Time/Side header row")
+
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        try:
+            if len(row) < len(COLUMNS):
+                raise HighlightFormatError(f"expected {len(COLUMNS)} columns")
+            placement = int(row[0])
+            camera = row[1].strip() or DEFAULT_CAMERA
+            time_ms = parse_time_to_ms(row[2])
+            side = normalize_side(row[3])
+        except ValueError as e:
+            if strict:
+                raise HighlightFormatError(f"Line {reader.line_num}: {e}") from None
+            if on_invalid:
+                on_invalid(reader.line_num, str(e))
+            continue
+        yield date, Marker(placement, camera, time_ms, side)
+
+
+def default_file_name(now=None):
+    """Default file name for a newly saved highlight CSV"""
+    now = now or datetime.now()
+    return f"highlights_{now.strftime('%Y%m%d_%H%M%S')}.csv"
+
@@ -0,0 +1,38 @@
+"""
+Startup probe for measuring launch-to-first-paint of Pobre Media Player
+"""
+import time
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent, QTimer
+
+
+class FirstPaintProbe(QObject):
+    """
+    Record when a window is first painted, then quit the application
+
+    The wall-clock time (time.time()) is written to a file so an external
+    process can compare it with the moment it launched the player.
+    """
+
+    def __init__(self, window, path):
+        """
+        Args:
+            window: The top-level window to watch
+            path: File to write the first paint timestamp to
+        """
+        super().__init__(window)
+        self.path = path
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """Wait for the first paint event, then record it once painting is done"""
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            QTimer.singleShot(0, self.record)
+        return False
+
+    def record(self):
+        """Write the first paint timestamp and quit"""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(repr(time.time()))
+        QApplication.quit()
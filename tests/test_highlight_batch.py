@@ -0,0 +1,86 @@
+"""
+Tests for the headless Highlight CSV batch tool
+"""
+from datetime import date
+
+from src.tools.highlight_batch import dedupe_markers, main, merge_files
+
+
+def write_csv(path, rows, date_str="2/23/2026"):
+    lines = [f"Date,{date_str},,,", "Placement,Camera,Time,Side"]
+    lines += [",".join(str(cell) for cell in row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_dedupe_markers_drops_within_tolerance():
+    markers = [(0, "left"), (800, "left"), (1000, "left"), (1001, "left")]
+    assert dedupe_markers(markers, 1000) == [(0, "left"), (1001, "left")]
+
+
+def test_dedupe_markers_chains_from_last_kept_marker():
+    # 1600 is within 1000 of the dropped 800 but not of the kept 0
+    markers = [(1600, "left"), (0, "left"), (800, "left")]
+    assert dedupe_markers(markers, 1000) == [(0, "left"), (1600, "left")]
+
+
+def test_dedupe_markers_keeps_sides_separate():
+    markers = [(0, "left"), (500, "right"), (600, "left")]
+    assert dedupe_markers(markers, 1000) == [(0, "left"), (500, "right")]
+
+
+def test_dedupe_markers_zero_tolerance_keeps_sub_second_markers():
+    assert dedupe_markers([(10000, "left"), (10500, "left"), (10000, "left")], 0) == [
+        (10000, "left"), (10500, "left")]
+
+
+def test_merge_files_groups_by_date_and_camera(tmp_path):
+    a = write_csv(tmp_path / "a.csv", [(1, "Cam1", "00:00:01", "left"), (2, "Cam2", "00:00:02", "right")])
+    b = write_csv(tmp_path / "b.csv", [(1, "Cam1", "00:00:01", "left"), (2, "Cam1", "00:00:03", "left")])
+    c = write_csv(tmp_path / "c.csv", [(1, "Cam1", "00:00:04", "left")], date_str="2/24/2026")
+
+    merged, stats = merge_files([a, b, c], jobs=1)
+
+    assert merged == {
+        (date(2026, 2, 23), "Cam1"): {(1000, "left"), (3000, "left")},
+        (date(2026, 2, 23), "Cam2"): {(2000, "right")},
+        (date(2026, 2, 24), "Cam1"): {(4000, "left")},
+    }
+    assert stats == {'files': 3, 'failed': 0, 'rows': 5, 'invalid': 0}
+
+
+def test_merge_files_reports_bad_files_and_rows(tmp_path):
+    good = write_csv(tmp_path / "good.csv", [(1, "Cam1", "00:00:01", "left"), (2, "Cam1", "bad", "left")])
+    junk = tmp_path / "junk.csv"
+    junk.write_text("junk\n", encoding="utf-8")
+    huge = tmp_path / "huge.csv"
+    huge.write_text('Date,2/23/2026,,,\nPlacement,Camera,Time,Side\n1,Cam1,"' + "x" * 200000 + '",left\n',
+                    encoding="utf-8")
+    errors = []
+
+    merged, stats = merge_files([good, str(junk), str(huge), str(tmp_path / "missing.csv")], jobs=1,
+                                on_error=lambda path, message: errors.append(path))
+
+    assert merged == {(date(2026, 2, 23), "Cam1"): {(1000, "left")}}
+    assert stats == {'files': 4, 'failed': 3, 'rows': 1, 'invalid': 1}
+    assert sorted(errors) == sorted([good, str(junk), str(huge), str(tmp_path / "missing.csv")])
+
+
+def test_merge_files_strict_rejects_whole_file(tmp_path):
+    path = write_csv(tmp_path / "a.csv", [(1, "Cam1", "00:00:01", "left"), (2, "Cam1", "bad", "left")])
+    merged, stats = merge_files([path], jobs=1, strict=True)
+    assert merged == {}
+    assert stats['failed'] == 1
+
+
+def test_main_writes_combined_output(tmp_path, capsys):
+    write_csv(tmp_path / "a.csv", [(1, "Cam1", "00:00:10", "left"), (2, "Cam1", "00:00:10.5", "left")])
+    output = tmp_path / "out.csv"
+
+    assert main([str(tmp_path / "a.csv"), "-j", "1", "-t", "0", "-o", str(output)]) == 0
+
+    assert output.read_text(encoding="utf-8").splitlines() == [
+        "Date,Camera,Placement,Time,Side",
+        "2/23/2026,Cam1,1,00:00:10,left",
+        "2/23/2026,Cam1,2,00:00:10.500,left",
+    ]
@@ -0,0 +1,76 @@
+"""
+Tests for the Highlight CSV file format (no Qt required)
+"""
+import io
+from datetime import date
+
+import pytest
+
+from src.tools.highlight_format import (HighlightFormatError, format_timestamp, iter_highlights,
+                                        normalize_time, parse_time_to_ms, write_highlights)
+
+
+HEADER = "Date,2/23/2026,,,\nPlacement,Camera,Time,Side\n"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("00:00:00", 0),
+    ("01:02:03", 3723000),
+    ("1:24", 84000),
+    (" 00:01:23 ", 83000),
+    ("00:00:10.5", 10500),
+    ("100:00:00", 360000000),
+])
+def test_parse_time_to_ms(text, expected):
+    assert parse_time_to_ms(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "abc", "10", "1:2:3:4", "00:60:00", "00:00:60", "-1:00:00", "00:aa:00"])
+def test_parse_time_to_ms_rejects_invalid(text):
+    with pytest.raises(HighlightFormatError):
+        parse_time_to_ms(text)
+
+
+def test_format_timestamp_keeps_milliseconds():
+    assert format_timestamp(83000) == "00:01:23"
+    assert format_timestamp(10500) == "00:00:10.500"
+    assert normalize_time("0:1:2") == "00:01:02"
+
+
+def test_write_then_read_round_trip():
+    buf = io.StringIO()
+    write_highlights(buf, date(2026, 2, 3), [("Cam1", "00:01:02", "left"), ("Cam2", "00:00:10.500", "right")])
+    buf.seek(0)
+    rows = list(iter_highlights(buf))
+    assert [d for d, _ in rows] == [date(2026, 2, 3)] * 2
+    assert [(m.placement, m.camera, m.time_ms, m.side) for _, m in rows] == [
+        (1, "Cam1", 62000, "left"),
+        (2, "Cam2", 10500, "right"),
+    ]
+
+
+def test_iter_highlights_normalizes_values():
+    buf = io.StringIO(HEADER + "1,,1:24,Left\n\n2,Cam2,00:00:05, RIGHT \n")
+    markers = [m for _, m in iter_highlights(buf)]
+    assert [(m.camera, m.time_ms, m.side) for m in markers] == [("Cam1", 84000, "left"), ("Cam2", 5000, "right")]
+
+
+def test_iter_highlights_strict_raises_on_bad_row():
+    buf = io.StringIO(HEADER + "1,Cam1,00:00:01,left\n2,Cam1,bad,left\n")
+    with pytest.raises(HighlightFormatError, match="Line 4"):
+        list(iter_highlights(buf, strict=True))
+
+
+def test_iter_highlights_non_strict_skips_and_reports_bad_rows():
+    buf = io.StringIO(HEADER + "1,Cam1,00:00:01,left\n2,Cam1,bad,left\n3,Cam1,00:00:02,up\n4,Cam1\n")
+    skipped = []
+    markers = [m for _, m in iter_highlights(buf, strict=False,
+                                             on_invalid=lambda line, message: skipped.append(line))]
+    assert [m.time_ms for m in markers] == [1000]
+    assert skipped == [4, 5, 6]
+
+
+@pytest.mark.parametrize("text", ["", "junk\n", "Date,13/40/2026\n", "Date,2/23/2026\nTime,Side\n"])
+def test_iter_highlights_rejects_bad_header(text):
+    with pytest.raises(HighlightFormatError):
+        list(iter_highlights(io.StringIO(text), strict=False))
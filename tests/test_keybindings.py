@@ -0,0 +1,101 @@
+"""
+Tests for keyboard shortcut configuration (QtCore/QtGui only, no display)
+"""
+import json
+
+import pytest
+
+pytest.importorskip("PyQt6.QtGui")
+
+from PyQt6.QtCore import Qt, QKeyCombination
+
+from src.config import SEEK_STEP_MS, VOLUME_STEP
+from src.player.keybindings import (ACTIONS, DEFAULT_KEYBINDINGS, build_key_map, load_keybindings,
+                                    lookup_key)
+
+
+def load(tmp_path, data):
+    path = tmp_path / "keybindings.json"
+    path.write_text(data if isinstance(data, str) else json.dumps(data), encoding="utf-8")
+    return load_keybindings(str(path))
+
+
+def test_missing_file_uses_defaults(tmp_path):
+    bindings, settings, errors = load_keybindings(str(tmp_path / "missing.json"))
+    assert bindings == DEFAULT_KEYBINDINGS
+    assert settings["seek_step_seconds"] == SEEK_STEP_MS
+    assert errors == []
+
+
+def test_user_bindings_and_settings_override_defaults(tmp_path):
+    bindings, settings, errors = load(tmp_path, {
+        "bindings": {"seek_forward": ["Right", "D"], "play_pause": "K", "volume_up": []},
+        "seek_step_seconds": 5,
+        "seek_acceleration": 1.5,
+        "volume_step": 10,
+    })
+    assert errors == []
+    assert bindings["seek_forward"] == ["Right", "D"]
+    assert bindings["play_pause"] == ["K"]
+    assert bindings["volume_up"] == []
+    assert bindings["seek_backward"] == DEFAULT_KEYBINDINGS["seek_backward"]
+    assert settings["seek_step_seconds"] == 5000
+    assert settings["seek_acceleration"] == 1.5
+    assert settings["volume_step"] == 10
+
+
+@pytest.mark.parametrize("data", ["{not json", "[1, 2]", {"bindings": ["Space"]}, {"bindings": "Space"}])
+def test_malformed_file_reports_error_and_keeps_defaults(tmp_path, data):
+    bindings, settings, errors = load(tmp_path, data)
+    assert bindings == DEFAULT_KEYBINDINGS
+    assert settings["volume_step"] == VOLUME_STEP
+    assert len(errors) == 1
+
+
+def test_unknown_action_and_bad_keys_are_reported(tmp_path):
+    bindings, _, errors = load(tmp_path, {"bindings": {"bogus": ["X"], "seek_forward": [1, 2]}})
+    assert bindings == DEFAULT_KEYBINDINGS
+    assert errors == ["Unknown action: bogus", "Invalid keys for seek_forward: [1, 2]"]
+
+
+@pytest.mark.parametrize("name, value", [
+    ("seek_step_seconds", 1e308),
+    ("seek_step_seconds", "Infinity"),
+    ("seek_step_seconds", "NaN"),
+    ("seek_step_seconds", 0.0001),
+    ("seek_step_seconds", -3),
+    ("seek_step_seconds", True),
+    ("seek_acceleration", 0.5),
+    ("volume_step", 0.5),
+    ("volume_step", "5"),
+])
+def test_invalid_setting_values_keep_default(tmp_path, name, value):
+    # JSON has no literal for inf/nan; Python's json accepts Infinity and NaN
+    raw = value if value in ("Infinity", "NaN") else json.dumps(value)
+    _, settings, errors = load(tmp_path, '{"%s": %s}' % (name, raw))
+    _, defaults, _ = load_keybindings(str(tmp_path / "missing.json"))
+    assert settings == defaults
+    assert len(errors) == 1
+
+
+def test_build_key_map_reports_conflicts_and_invalid_keys():
+    handlers = {action: action for action in ACTIONS}
+    key_map, errors = build_key_map({"play_pause": ["S"], "add_timestamp": ["S", "Ctrl+Nope"]}, handlers)
+    assert lookup_key(key_map, QKeyCombination(Qt.Key.Key_S)) == ("add_timestamp", False)
+    assert errors == ["S is bound to both play_pause and add_timestamp",
+                      "Invalid key for add_timestamp: 'Ctrl+Nope'"]
+
+
+def test_lookup_key_prefers_exact_combination_and_falls_back_to_bare_key():
+    handlers = {action: action for action in ACTIONS}
+    key_map, errors = build_key_map({"seek_forward": ["Right"], "seek_backward": ["Shift+Right"],
+                                     "add_timestamp": ["S"]}, handlers)
+    assert errors == []
+    shift = Qt.KeyboardModifier.ShiftModifier
+    assert lookup_key(key_map, QKeyCombination(shift, Qt.Key.Key_Right)) == ("seek_backward", True)
+    assert lookup_key(key_map, QKeyCombination(Qt.KeyboardModifier.ControlModifier, Qt.Key.Key_Right)) \
+        == ("seek_forward", True)
+    assert lookup_key(key_map, QKeyCombination(shift, Qt.Key.Key_S)) == ("add_timestamp", False)
+    assert lookup_key(key_map, QKeyCombination(Qt.KeyboardModifier.KeypadModifier, Qt.Key.Key_Right)) \
+        == ("seek_forward", True)
+    assert lookup_key(key_map, QKeyCombination(Qt.Key.Key_X)) is None
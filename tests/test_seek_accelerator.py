@@ -0,0 +1,139 @@
+"""
+Tests for accelerating, coalesced keyboard seeking (QtCore only, no display)
+"""
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from PyQt6.QtCore import QCoreApplication
+
+from src.player.seek_accelerator import SeekAccelerator
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+class FakeMediaPlayer:
+    def __init__(self, position=10000, duration=600000):
+        self._position = position
+        self._duration = duration
+        self.seeks = []
+
+    def position(self):
+        return self._position
+
+    def duration(self):
+        return self._duration
+
+    def setPosition(self, position):
+        self.seeks.append(position)
+        self._position = position
+
+
+class FakeElapsedTimer:
+    def __init__(self):
+        self.ms = 0
+
+    def start(self):
+        self.ms = 0
+
+    def elapsed(self):
+        return self.ms
+
+
+@pytest.fixture
+def seeker(app):
+    player = FakeMediaPlayer()
+    accelerator = SeekAccelerator(player, step_ms=3000, hold_speed=10000, max_speed=120000, acceleration=2.0)
+    accelerator.hold_timer = FakeElapsedTimer()
+    return accelerator, player
+
+
+def test_single_press_seeks_one_step_immediately(seeker):
+    accelerator, player = seeker
+    accelerator.seek(1)
+    assert player.seeks == [13000]
+
+
+def test_held_key_is_coalesced_into_one_pending_seek(seeker):
+    accelerator, player = seeker
+    accelerator.seek(1)
+    for ms in range(20, 1001, 20):
+        accelerator.hold_timer.ms = ms
+        accelerator.seek(1, repeat=True)
+    # Only the first press reached the player; the rest wait for the timer
+    assert player.seeks == [13000]
+    assert accelerator.pending
+    accelerator.check_pending()
+    assert player.seeks == [13000, accelerator.target]
+    assert not accelerator.pending
+
+
+def test_hold_distance_depends_on_time_not_repeat_count(seeker):
+    accelerator, _ = seeker
+    targets = []
+    for interval in (16, 40):  # ~60 Hz and 25 Hz key repeat
+        accelerator.timer.stop()
+        accelerator.media_player._position = 10000
+        accelerator.seek(1)
+        for ms in range(interval, 2001, interval):
+            accelerator.hold_timer.ms = ms
+            accelerator.seek(1, repeat=True)
+        accelerator.hold_timer.ms = 2000
+        accelerator.seek(1, repeat=True)
+        targets.append(accelerator.target)
+    assert targets[0] == targets[1] == 13000 + accelerator.hold_distance(2000)
+
+
+def test_hold_distance_accelerates_and_caps_speed(seeker):
+    accelerator, _ = seeker
+    one, two, three = (accelerator.hold_distance(ms) for ms in (1000, 2000, 3000))
+    assert 10000 < one < 20000
+    assert two - one > one
+    # Past the cap the distance grows at exactly the maximum speed
+    assert accelerator.hold_distance(11000) - accelerator.hold_distance(10000) == 120000
+
+
+def test_rapid_presses_build_on_pending_target(seeker):
+    accelerator, player = seeker
+    accelerator.seek(1)
+    accelerator.seek(1)
+    accelerator.seek(1)
+    assert accelerator.target == 19000
+    accelerator.check_pending()
+    assert player.seeks == [13000, 19000]
+
+
+def test_target_is_clamped_to_media(seeker):
+    accelerator, player = seeker
+    accelerator.seek(-1)
+    accelerator.hold_timer.ms = 5000
+    accelerator.seek(-1, repeat=True)
+    assert accelerator.target == 0
+    player._duration = 20000
+    accelerator.timer.stop()
+    accelerator.seek(1)
+    accelerator.hold_timer.ms = 5000
+    accelerator.seek(1, repeat=True)
+    assert accelerator.target == 20000
+
+
+def test_direction_change_restarts_from_single_step(seeker):
+    accelerator, _ = seeker
+    accelerator.seek(1)
+    accelerator.hold_timer.ms = 1000
+    accelerator.seek(1, repeat=True)
+    held_target = accelerator.target
+    accelerator.seek(-1, repeat=True)
+    assert accelerator.target == held_target - 3000
+
+
+def test_is_seeking_until_coalesce_interval_passes(seeker):
+    accelerator, _ = seeker
+    assert not accelerator.is_seeking()
+    accelerator.seek(1)
+    assert accelerator.is_seeking()
+    accelerator.timer.stop()
+    assert not accelerator.is_seeking()